@@ -1,100 +1,115 @@
 #!/usr/bin/env python3
 """Generate mkdocs.yml from base config and converted essays nav."""
 
+import json
+import os
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed C emitter when available
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# mkdocs.yml around the essays nav, written out literally so only the nav goes
+# through yaml.dump (and so the emoji extension can carry its !!python/name tags)
+CONFIG_HEAD = """\
+site_name: James Oliver
+site_url: https://jamesxoliver.github.io
+site_description: Essays on systems, science, and structure — finding simplicity in
+  complexity.
+site_author: James Oliver
+theme:
+  name: material
+  palette:
+  - media: '(prefers-color-scheme: light)'
+    scheme: default
+    toggle:
+      icon: material/brightness-7
+      name: Switch to dark mode
+  - media: '(prefers-color-scheme: dark)'
+    scheme: slate
+    toggle:
+      icon: material/brightness-4
+      name: Switch to light mode
+  font:
+    text: Inter
+    code: JetBrains Mono
+  features:
+  - navigation.sections
+  - search.suggest
+  - search.highlight
+  - toc.integrate
+nav:
+- Home: index.md
+"""
+
+CONFIG_TAIL = """\
+markdown_extensions:
+- tables
+- admonition
+- pymdownx.arithmatex:
+    generic: true
+- pymdownx.highlight
+- pymdownx.superfences
+- pymdownx.details
+- attr_list
+- md_in_html
+- toc:
+    permalink: true
+- pymdownx.emoji:
+    emoji_index: !!python/name:material.extensions.emoji.twemoji
+    emoji_generator: !!python/name:material.extensions.emoji.to_svg
+- meta
+plugins:
+- search
+extra_css:
+- stylesheets/extra.css
+extra_javascript:
+- javascripts/mathjax.js
+- https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js
+extra:
+  generator: false
+  social:
+  - icon: fontawesome/brands/github
+    link: https://github.com/jamesxoliver
+  - icon: fontawesome/brands/orcid
+    link: https://orcid.org/0009-0003-9912-095X
+  - icon: simple/zenodo
+    link: https://zenodo.org/communities/jamesoliver/records
+"""
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write content to path unless the file already holds exactly that content."""
+    data = content.encode()
+    if path.exists() and path.read_bytes() == data:
+        return False
+    # A fixed temp name is safe here: this script writes from a single thread,
+    # unlike convert.py's worker pool, which needs a per-thread name
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
 
 def main():
     # Load nav fragment from conversion step
-    nav_path = Path("docs/_nav.yml")
+    nav_path = Path("docs/_nav.json")
     if not nav_path.exists():
         print("No nav fragment found, skipping config generation")
         return
 
-    nav_data = yaml.safe_load(nav_path.read_text())
+    nav_data = json.loads(nav_path.read_text())
     nav_essays = nav_data.get("nav_essays", [])
 
-    config = {
-        "site_name": "James Oliver",
-        "site_url": "https://jamesxoliver.github.io",
-        "site_description": "Essays on systems, science, and structure — finding simplicity in complexity.",
-        "site_author": "James Oliver",
-        "theme": {
-            "name": "material",
-            "palette": [
-                {
-                    "media": "(prefers-color-scheme: light)",
-                    "scheme": "default",
-                    "toggle": {
-                        "icon": "material/brightness-7",
-                        "name": "Switch to dark mode",
-                    },
-                },
-                {
-                    "media": "(prefers-color-scheme: dark)",
-                    "scheme": "slate",
-                    "toggle": {
-                        "icon": "material/brightness-4",
-                        "name": "Switch to light mode",
-                    },
-                },
-            ],
-            "font": {"text": "Inter", "code": "JetBrains Mono"},
-            "features": [
-                "navigation.sections",
-                "search.suggest",
-                "search.highlight",
-                "toc.integrate",
-            ],
-        },
-        "nav": [
-            {"Home": "index.md"},
-        ] + nav_essays,
-        "markdown_extensions": [
-            "tables",
-            "admonition",
-            {"pymdownx.arithmatex": {"generic": True}},
-            "pymdownx.highlight",
-            "pymdownx.superfences",
-            "pymdownx.details",
-            "attr_list",
-            "md_in_html",
-            {"toc": {"permalink": True}},
-            "pymdownx.emoji",
-            "meta",
-        ],
-        "plugins": [
-            "search",
-        ],
-        "extra_css": [
-            "stylesheets/extra.css",
-        ],
-        "extra_javascript": [
-            "javascripts/mathjax.js",
-            "https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js",
-        ],
-        "extra": {
-            "generator": False,
-            "social": [
-                {"icon": "fontawesome/brands/github", "link": "https://github.com/jamesxoliver"},
-                {"icon": "fontawesome/brands/orcid", "link": "https://orcid.org/0009-0003-9912-095X"},
-                {"icon": "simple/zenodo", "link": "https://zenodo.org/communities/jamesoliver/records"},
-            ],
-        },
-    }
-
-    yml_text = yaml.dump(config, default_flow_style=False, allow_unicode=True, sort_keys=False)
-
-    # Replace pymdownx.emoji string entry with full config block (YAML tags can't go through yaml.dump)
-    yml_text = yml_text.replace(
-        "- pymdownx.emoji\n",
-        "- pymdownx.emoji:\n"
-        "    emoji_index: !!python/name:material.extensions.emoji.twemoji\n"
-        "    emoji_generator: !!python/name:material.extensions.emoji.to_svg\n",
-    )
+    # Only the essays nav is dynamic; the rest of the config is a fixed template
+    nav_yaml = ""
+    if nav_essays:
+        nav_yaml = yaml.dump(
+            nav_essays, Dumper=Dumper, default_flow_style=False, allow_unicode=True, sort_keys=False,
+        )
+    yml_text = CONFIG_HEAD + nav_yaml + CONFIG_TAIL
 
-    Path("mkdocs.yml").write_text(yml_text)
+    _write_if_changed(Path("mkdocs.yml"), yml_text)
     print("mkdocs.yml generated")
 
 
@@ -1,60 +1,224 @@
 #!/usr/bin/env python3
 """Convert .tex files from the papers repo into MkDocs-ready markdown."""
 
+import argparse
+import hashlib
+import io
+import json
 import os
 import re
+import shutil
+import socket
 import subprocess
-import yaml
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
 
 PAPERS_DIR = Path(os.environ.get("PAPERS_DIR", "papers"))
 DOCS_DIR = Path("docs/essays")
-SKIP_DIRS = {"0_Format"}
-
-
-def get_git_dates(tex_path: Path) -> tuple[str | None, str | None]:
-    """Get first commit date (published) and last commit date (updated) from git log."""
+CACHE_DIR = Path(".cache/convert")
+GIT_DATES_CACHE = Path(".cache/git_dates.json")
+# Bump whenever tex_to_md or clean_md output changes, to invalidate cached markdown
+CACHE_VERSION = "v3"
+SKIP_DIRS = frozenset({"0_Format"})
+PANDOC_TO = "markdown-simple_tables-multiline_tables-grid_tables"
+
+# Patterns used for every essay, compiled once
+_TITLE_RE = re.compile(r"\\newcommand\{\\DocumentTitle\}\{(.+?)\}")
+_SUBTITLE_RE = re.compile(r"\\newcommand\{\\DocumentSubtitle\}\{(.+?)\}")
+_TEX_MACRO_RE = re.compile(r"\\(?:textbf|emph)\{(.+?)\}")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_BLANK_RE = re.compile(r"\n{3,}")
+_TEMPLATE_RE = re.compile(r"template", re.IGNORECASE)
+_RELATED_RE = re.compile(r"\\RelatedEssays\{(.+?)\}")
+_PUBLISH_READY_RE = re.compile(r"^%\s*PublishReady:\s*yes", re.MULTILINE)
+# \input{file}, \include{file}, or TeX's braceless \input file
+_INCLUDE_RE = re.compile(r"\\(?:input|include)(?:\s*\{([^}]*)\}|\s+([^\s{}\\%]+))")
+
+# Markdown → plain text, for meta descriptions and reading time
+_INLINE_MATH_RE = re.compile(r"\$[^$]+\$")
+_DISPLAY_MATH_RE = re.compile(r"\$\$[^$]*\$\$")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_IMG_RE = re.compile(r"!\[.*?\]\(.*?\)")
+_MD_CHARS_RE = re.compile(r"[#*_`~>|]")
+_HR_RE = re.compile(r"-{3,}")
+
+# Pandoc output cleanup (clean_md)
+_ATTR_RE = re.compile(r"\s*\{#[^}]*\}")
+_TCB_RE = re.compile(r"^:{2,}\s*tcolorbox\s*$", re.MULTILINE)
+_COLONS_RE = re.compile(r"^:{2,}\s*$", re.MULTILINE)
+_CITE_RE = re.compile(r"\[(@[a-zA-Z0-9_-]+[;,\s]*)+\]")
+_LINE_BREAK_RE = re.compile(r"\\\\\s*$", re.MULTILINE)
+_BIB_RE = re.compile(r"^::: thebibliography\n\d+\n*", re.MULTILINE)
+# Punctuation fixes, fused into one pass and dispatched on the matching group.
+# A stray \\ directly before an escaped quote is skipped, as it was when
+# quotes were unescaped in a pass of their own first.
+_PUNCT_RE = re.compile(
+    r"(?P<space_period> +\.)"
+    r"|(?P<space_comma> +,)"
+    r"|(?P<blank>\n{3,})"
+    r"|(?P<emdash>(?<=\w)---(?=\w))"
+    r'|(?P<quote>\\")'
+    r'|(?P<backslash>(?<!\$)\\\\(?![$"]))'
+)
+_PUNCT_REPLACEMENTS = {
+    "space_period": ".",
+    "space_comma": ",",
+    "blank": "\n\n",
+    "emdash": "\u2014",
+    "quote": '"',
+    "backslash": " ",
+}
+_CAPTION_RE = re.compile(r"^: (.+)$", re.MULTILINE)
+_LIST_ITEM_RE = re.compile(r"-   |\d+\.\s")
+_FIRST_SECTION_RE = re.compile(r"^## .+\n+")
+_MATH_OPEN_RE = re.compile(r"(?<!\n)\$\$")
+_MATH_CLOSE_RE = re.compile(r"\$\$(?!\n)")
+_MATH_BLOCK_RE = re.compile(r"\n?\$\$\n(.*?)\n\$\$\n?", re.DOTALL)
+
+# Fast-path LaTeX → markdown for essays that only use a handful of simple commands
+_FAST_BODY_RE = re.compile(r"\\begin\{document\}(.*?)\\end\{document\}", re.DOTALL)
+_FAST_COMMENT_RE = re.compile(r"(?<!\\)%[^\n]*\n?[ \t]*")
+_FAST_MATH_RE = re.compile(r"\$\$.+?\$\$|\$[^$]+\$", re.DOTALL)
+_FAST_UNSAFE_RE = re.compile(r"[*_\[\]#<>`~^&|\"@]|''")
+_FAST_LIST_RE = re.compile(r"\\begin\{(itemize|enumerate)\}(.*?)\\end\{\1\}", re.DOTALL)
+_FAST_ITEM_RE = re.compile(r"\\item\b\s*")
+_FAST_HEADING_RE = re.compile(r"\\((?:sub){0,2})section\{([^{}\\]*)\}")
+_FAST_STYLE_RE = re.compile(r"\\(emph|textit|textbf)\{([^{}\\]*)\}")
+_FAST_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_FAST_SPACE_RE = re.compile(r"\s+")
+# Text pandoc writes unescaped at the start of a paragraph, heading, or list item:
+# a word or masked math, but not something that reads as a list marker
+_FAST_PLAIN_START_RE = re.compile(r"(?!\d+[.)])[\w\x00]")
+_FAST_MASK_RE = re.compile(r"\x00(\d+)\x00")
+_FAST_MACRO_DEF_RE = re.compile(
+    r"\\(?:(?:re|provide)?newcommand|DeclareMathOperator|(?:re)?newenvironment|def|let)\b"
+    r"\*?\s*\{?\s*\\?([A-Za-z@]+)"
+)
+_FAST_COMMAND_RE = re.compile(r"\\([A-Za-z@]+)")
+# Leading title block pandoc emits: "# " headings, author lines, blank lines
+_PANDOC_HEADER_RE = re.compile(
+    r"\A(?:# [^\n]*(?:\n|\Z)"
+    r"|[^\S\n]*\*\*[^\n]*(?:james oliver|author)[^\n]*(?:\n|\Z)"
+    r"|[^\S\n]*(?:\n|\Z))*",
+    re.IGNORECASE,
+)
+
+
+def load_git_dates() -> tuple[dict[str, str], dict[str, str]]:
+    """Map every file path to its first and last commit dates with a single git log walk.
+
+    History is streamed oldest-first, so the first commit touching a path is its
+    published date and the last is its updated date. Renames carry the
+    published date over to the new path, like ``git log --follow``.
+    """
+    first_date = {}
+    last_date = {}
     try:
-        # First commit date (published)
-        result = subprocess.run(
-            ["git", "log", "--diff-filter=A", "--follow", "--format=%aI", "--", str(tex_path)],
-            capture_output=True, text=True, cwd=PAPERS_DIR,
+        proc = subprocess.Popen(
+            [
+                "git", "-c", "core.quotePath=false", "log", "--reverse",
+                "--format=__COMMIT__%aI", "--name-status", "--diff-filter=AMR", "-M", "--relative",
+                "--", "*.tex",
+            ],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, cwd=PAPERS_DIR,
         )
-        published = None
-        if result.returncode == 0 and result.stdout.strip():
-            dates = result.stdout.strip().split("\n")
-            published = dates[-1][:10]  # earliest date, YYYY-MM-DD
-
-        # Last commit date (updated)
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%aI", "--", str(tex_path)],
+    except Exception:
+        return first_date, last_date
+
+    with proc:
+        date = None
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("__COMMIT__"):
+                date = line[10:20]  # YYYY-MM-DD
+                continue
+            if not line:
+                continue
+            status, *paths = line.split("\t")
+            path = paths[-1]
+            if status.startswith("R") and len(paths) == 2:
+                first_date.setdefault(path, first_date.get(paths[0], date))
+            else:
+                first_date.setdefault(path, date)
+            last_date[path] = date
+    if proc.returncode != 0:
+        return {}, {}
+    return first_date, last_date
+
+
+def cached_git_dates() -> tuple[dict[str, str], dict[str, str]]:
+    """Return load_git_dates() for the current HEAD, reusing the on-disk copy when history is unchanged."""
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
             capture_output=True, text=True, cwd=PAPERS_DIR,
+        ).stdout.strip()
+    except Exception:
+        head = ""
+
+    if head:
+        try:
+            cached = json.loads(GIT_DATES_CACHE.read_text())
+        except (OSError, ValueError):
+            cached = {}
+        # Anything but a well-formed entry for this HEAD is a miss
+        if (
+            isinstance(cached, dict) and cached.get("head") == head
+            and isinstance(cached.get("first"), dict) and isinstance(cached.get("last"), dict)
+        ):
+            return cached["first"], cached["last"]
+
+    first_date, last_date = load_git_dates()
+    if head and last_date:
+        GIT_DATES_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _write_if_changed(
+            GIT_DATES_CACHE,
+            json.dumps({"head": head, "first": first_date, "last": last_date}, ensure_ascii=False),
         )
-        updated = None
-        if result.returncode == 0 and result.stdout.strip():
-            updated = result.stdout.strip()[:10]
+    return first_date, last_date
 
-        return published, updated
-    except Exception:
-        return None, None
+
+def get_git_dates(tex_path: Path, first_date: dict, last_date: dict) -> tuple[str | None, str | None]:
+    """Look up first commit date (published) and last commit date (updated) for a file."""
+    key = tex_path.as_posix()
+    return first_date.get(key), last_date.get(key)
+
+
+def find_tex_files() -> list[Path]:
+    """List .tex files under PAPERS_DIR, never descending into skipped or .git directories."""
+    top = os.fspath(PAPERS_DIR)
+    tex_files = []
+    for dirpath, dirnames, filenames in os.walk(top):
+        if dirpath == top:
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and d != ".git"]
+        tex_files.extend(Path(dirpath, f) for f in filenames if f.endswith(".tex"))
+    return sorted(tex_files)
 
 
 def extract_title(tex_content: str) -> str:
     """Extract the document title from \\newcommand{\\DocumentTitle}{...}."""
-    match = re.search(r"\\newcommand\{\\DocumentTitle\}\{(.+?)\}", tex_content)
+    match = _TITLE_RE.search(tex_content)
     if match:
         title = match.group(1)
         # Clean up LaTeX formatting in title
         title = title.replace("--", "\u2013")
-        title = re.sub(r"\\textbf\{(.+?)\}", r"\1", title)
-        title = re.sub(r"\\emph\{(.+?)\}", r"\1", title)
+        title = _TEX_MACRO_RE.sub(r"\1", title)
         return title
     return None
 
 
 def extract_subtitle(tex_content: str) -> str:
     """Extract subtitle from \\newcommand{\\DocumentSubtitle}{...}."""
-    match = re.search(r"\\newcommand\{\\DocumentSubtitle\}\{(.+?)\}", tex_content)
+    match = _SUBTITLE_RE.search(tex_content)
     if match:
         sub = match.group(1).strip()
         if sub and sub != "Subtitle" and sub != "":
@@ -62,20 +226,115 @@ def extract_subtitle(tex_content: str) -> str:
     return None
 
 
-def tex_to_md(tex_path: Path) -> str | None:
-    """Convert a .tex file to markdown using pandoc."""
+def _start_pandoc_server(args: list[str]) -> tuple[subprocess.Popen, str] | None:
+    """Start ``pandoc server`` with args and wait for it to accept connections.
+
+    Returns the process and its URL, or None if it exited or never came up.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    try:
+        proc = subprocess.Popen(
+            ["pandoc", "server", f"--port={port}", "--timeout=120", *args],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+
+    url = f"http://127.0.0.1:{port}/"
+    for _ in range(50):
+        if proc.poll() is not None:
+            break
+        try:
+            urllib.request.urlopen(url + "version", timeout=1).close()
+            return proc, url
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    proc.wait()
+    return None
+
+
+@contextmanager
+def pandoc_server():
+    """Run a single long-lived ``pandoc server`` for the duration of the block.
+
+    Yields the server URL, or None if it could not be started (e.g. pandoc
+    built without server support), in which case callers fall back to one
+    pandoc process per file.
+    """
+    # +RTS -N lets the server parse requests on every core, but pandoc's
+    # official binaries are not built -threaded and exit on the flag, so
+    # retry without it
+    for args in (["+RTS", "-N", "-RTS"], []):
+        started = _start_pandoc_server(args)
+        if started:
+            break
+    else:
+        yield None
+        return
+
+    proc, url = started
+    try:
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def _tex_search_path(tex_path: Path) -> list[str]:
+    """Directories searched for \\input/\\include files: cwd, the essay's directory, then TEXINPUTS."""
+    dirs = [".", str(tex_path.parent)]
+    if os.environ.get("TEXINPUTS"):
+        dirs += os.environ["TEXINPUTS"].split(os.pathsep)
+    return dirs
+
+
+def tex_to_md(tex_content: str, tex_path: Path, server_url: str | None = None) -> str | None:
+    """Convert .tex source to markdown using pandoc.
+
+    Goes through the shared pandoc server when one is running, unless the
+    source pulls in other files, which the server's sandbox cannot read.
+    """
+    if server_url and not _INCLUDE_RE.search(tex_content):
+        payload = {
+            "text": tex_content,
+            "from": "latex",
+            "to": PANDOC_TO,
+            "wrap": "none",
+            "markdown-headings": "atx",
+            "shift-heading-level-by": 1,
+        }
+        request = urllib.request.Request(
+            server_url,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return json.load(response)["output"]
+        except urllib.error.HTTPError as e:
+            print(f"  pandoc error for {tex_path}: {e.read().decode(errors='replace')[:200]}")
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"  pandoc error for {tex_path}: {e}")
+            return None
+
+    # Source is piped on stdin; pandoc resolves \input/\include through TEXINPUTS
     result = subprocess.run(
         [
             "pandoc",
-            str(tex_path),
             "-f", "latex",
-            "-t", "markdown-simple_tables-multiline_tables-grid_tables",
+            "-t", PANDOC_TO,
             "--wrap=none",
             "--markdown-headings=atx",
             "--shift-heading-level-by=1",
         ],
+        input=tex_content,
         capture_output=True,
         text=True,
+        env={**os.environ, "TEXINPUTS": os.pathsep.join(_tex_search_path(tex_path))},
     )
     if result.returncode != 0:
         print(f"  pandoc error for {tex_path}: {result.stderr[:200]}")
@@ -83,6 +342,83 @@ def tex_to_md(tex_path: Path) -> str | None:
     return result.stdout
 
 
+def tex_to_md_fast(tex_content: str) -> str | None:
+    """Translate simple .tex source to markdown without pandoc.
+
+    Handles sections, emphasis, flat itemize/enumerate lists, and $-math.
+    Returns None if anything else is present, so the caller falls back to pandoc.
+    """
+    body_match = _FAST_BODY_RE.search(tex_content)
+    if not body_match or "\x00" in tex_content:
+        return None
+    body = _FAST_COMMENT_RE.sub("", body_match.group(1)).replace("\\maketitle", "")
+
+    # Pandoc expands the source's own macros, even inside math; this path cannot.
+    # Included files may define more, so they rule it out as well.
+    if _INCLUDE_RE.search(tex_content) or (
+        set(_FAST_MACRO_DEF_RE.findall(tex_content)) & set(_FAST_COMMAND_RE.findall(body))
+    ):
+        return None
+    body = body.replace("section*{", "section{")  # unnumbered headings render the same
+
+    # Math passes through verbatim; mask it so its commands don't trip the checks below
+    math = []
+
+    def mask(m: re.Match) -> str:
+        math.append(m.group(0))
+        return f"\x00{len(math) - 1}\x00"
+
+    body = _FAST_MATH_RE.sub(mask, body)
+    if "$" in body or _FAST_UNSAFE_RE.search(body):
+        return None
+
+    def render_list(m: re.Match) -> str:
+        items = _FAST_ITEM_RE.split(m.group(2))
+        if items[0].strip() or "\\begin" in m.group(2) or _FAST_PARA_SPLIT_RE.search(m.group(2)):
+            return m.group(0)  # left in place, so the unhandled-command check rejects it
+        texts = [_FAST_SPACE_RE.sub(" ", item).strip() for item in items[1:]]
+        if not all(_FAST_PLAIN_START_RE.match(text) for text in texts):
+            return m.group(0)
+        bullet = m.group(1) == "itemize"
+        # Pandoc pads list markers to four columns: "-   ", "1.  ", "10. "
+        lines = [
+            ("-   " if bullet else f"{n}.".ljust(3) + " ") + text
+            for n, text in enumerate(texts, 1)
+        ]
+        return "\n\n" + "\n".join(lines) + "\n\n"
+
+    def render_heading(m: re.Match) -> str:
+        text = m.group(2).strip()
+        if not _FAST_PLAIN_START_RE.match(text):
+            return m.group(0)
+        return f"\n\n{'#' * (len(m.group(1)) // 3 + 2)} {text}\n\n"
+
+    def render_style(m: re.Match) -> str:
+        # Pandoc moves edge spaces outside the markers; "* x *" would not be emphasis
+        if not m.group(2).strip() or m.group(2) != m.group(2).strip():
+            return m.group(0)
+        mark = "**" if m.group(1) == "textbf" else "*"
+        return f"{mark}{m.group(2)}{mark}"
+
+    body = _FAST_LIST_RE.sub(render_list, body)
+    body = _FAST_HEADING_RE.sub(render_heading, body)
+    body = _FAST_STYLE_RE.sub(render_style, body)
+    if "\\" in body or "{" in body or "}" in body:
+        return None
+
+    blocks = []
+    for block in _FAST_PARA_SPLIT_RE.split(body):
+        block = block.strip()
+        if block.startswith(("-   ", "1.  ", "#")):
+            blocks.append(block)  # headings and list items are already one per line
+        elif block and not _FAST_PLAIN_START_RE.match(block):
+            return None  # would need escaping to stay a plain paragraph
+        elif block:
+            blocks.append(_FAST_SPACE_RE.sub(" ", block))
+    md = "\n\n".join(blocks) + "\n"
+    return _FAST_MASK_RE.sub(lambda m: math[int(m.group(1))], md)
+
+
 def extract_first_paragraph(md_content: str) -> str:
     """Extract the first real paragraph from markdown content for meta description."""
     for line in md_content.split("\n"):
@@ -97,10 +433,10 @@ def extract_first_paragraph(md_content: str) -> str:
         if line.startswith("<") or line.startswith(":::") or line.startswith("---"):
             continue
         # Clean markdown formatting for plain text description
-        desc = re.sub(r"\$[^$]+\$", "", line)  # remove inline math
-        desc = re.sub(r"\*\*(.+?)\*\*", r"\1", desc)  # bold
-        desc = re.sub(r"\*(.+?)\*", r"\1", desc)  # italic
-        desc = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", desc)  # links
+        desc = _INLINE_MATH_RE.sub("", line)  # remove inline math
+        desc = _BOLD_RE.sub(r"\1", desc)  # bold
+        desc = _ITALIC_RE.sub(r"\1", desc)  # italic
+        desc = _LINK_RE.sub(r"\1", desc)  # links
         desc = desc.strip()
         if len(desc) > 30:
             # Truncate to ~155 chars for meta description
@@ -113,12 +449,12 @@ def extract_first_paragraph(md_content: str) -> str:
 def estimate_reading_time(md_content: str) -> int:
     """Estimate reading time in minutes from markdown content."""
     # Strip markdown formatting for word count
-    text = re.sub(r"\$\$[^$]*\$\$", " equation ", md_content)  # display math
-    text = re.sub(r"\$[^$]+\$", " equation ", text)  # inline math
-    text = re.sub(r"!\[.*?\]\(.*?\)", "", text)  # images
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)  # links
-    text = re.sub(r"[#*_`~>|]", "", text)  # markdown chars
-    text = re.sub(r"-{3,}", "", text)  # horizontal rules
+    text = _DISPLAY_MATH_RE.sub(" equation ", md_content)  # display math
+    text = _INLINE_MATH_RE.sub(" equation ", text)  # inline math
+    text = _IMG_RE.sub("", text)  # images
+    text = _LINK_RE.sub(r"\1", text)  # links
+    text = _MD_CHARS_RE.sub("", text)  # markdown chars
+    text = _HR_RE.sub("", text)  # horizontal rules
     words = len(text.split())
     minutes = max(1, round(words / 200))
     return minutes
@@ -126,95 +462,76 @@ def estimate_reading_time(md_content: str) -> int:
 
 def extract_related_essays(tex_content: str) -> list[str]:
     """Extract related essay slugs from \\RelatedEssays{slug1, slug2}."""
-    match = re.search(r"\\RelatedEssays\{(.+?)\}", tex_content)
+    match = _RELATED_RE.search(tex_content)
     if match:
         slugs = [s.strip() for s in match.group(1).split(",") if s.strip()]
         return slugs
     return []
 
 
-def clean_md(md_content: str, title: str, subtitle: str | None,
-             published: str | None = None, updated: str | None = None,
-             related_slugs: list[str] | None = None,
-             slug_to_info: dict | None = None) -> str:
+def clean_md(md_content: str) -> str:
     """Clean up pandoc output for MkDocs."""
-    lines = md_content.split("\n")
-    cleaned = []
-    skip_until_content = True
-
-    for line in lines:
-        # Skip pandoc-generated title block at the top
-        if skip_until_content:
-            if line.startswith("# ") or (line.strip() == "" and not cleaned):
-                continue
-            if line.strip().startswith("**") and any(
-                x in line.lower() for x in ["james oliver", "author"]
-            ):
-                continue
-            if line.strip() == "":
-                if not cleaned:
-                    continue
-            skip_until_content = False
-
-        cleaned.append(line)
-
-    md = "\n".join(cleaned).strip()
+    # Skip pandoc-generated title block at the top
+    md = _PANDOC_HEADER_RE.sub("", md_content, count=1).strip()
 
     # Clean up pandoc artifacts
-    md = re.sub(r"\n{3,}", "\n\n", md)
-    md = re.sub(r"\s*\{#[^}]*\}", "", md)
-    md = re.sub(r"^:{2,}\s*tcolorbox\s*$", "", md, flags=re.MULTILINE)
-    md = re.sub(r"^:{2,}\s*$", "", md, flags=re.MULTILINE)
-    md = re.sub(r"\[(@[a-zA-Z0-9_-]+[;,\s]*)+\]", "", md)
-    md = re.sub(r"\\\\\s*$", "", md, flags=re.MULTILINE)
+    md = _BLANK_RE.sub("\n\n", md)
+    md = _ATTR_RE.sub("", md)
+    md = _TCB_RE.sub("", md)
+    md = _COLONS_RE.sub("", md)
+    md = _CITE_RE.sub("", md)
+    md = _LINE_BREAK_RE.sub("", md)
 
     # Convert thebibliography environment to References heading
-    md = re.sub(r"^::: thebibliography\n\d+\n*", "\n## References\n\n", md, flags=re.MULTILINE)
-
-    # Clean up orphan spaces before punctuation (left by removed citations)
-    md = re.sub(r" +\.", ".", md)
-    md = re.sub(r" +,", ",", md)
+    md = _BIB_RE.sub("\n## References\n\n", md)
 
-    md = re.sub(r"\n{3,}", "\n\n", md)
-
-    # Fix em dashes: triple hyphens between words → —
-    md = re.sub(r"(?<=\w)---(?=\w)", "\u2014", md)
-
-    # Fix escaped quotes from pandoc
-    md = md.replace('\\"', '"')
-
-    # Remove stray \\ line breaks (mid-text, not in math)
-    md = re.sub(r"(?<!\$)\\\\(?!\$)", " ", md)
+    # In one pass: drop orphan spaces before punctuation (left by removed
+    # citations), collapse blank lines, turn triple hyphens between words into
+    # em dashes, unescape pandoc's quotes, and replace stray \\ line breaks
+    # outside math with a space. The artifact passes above stay separate:
+    # their trailing \s*$ makes each depend on what the one before removed.
+    md = _PUNCT_RE.sub(lambda m: _PUNCT_REPLACEMENTS[m.lastgroup], md)
 
     # Convert table captions to italic text below table
-    md = re.sub(r"^: (.+)$", r"*\1*", md, flags=re.MULTILINE)
-
-    # Collapse blank lines between list items
-    prev = None
-    while prev != md:
-        prev = md
-        md = re.sub(r"(\n-   .+)\n\n(-   )", r"\1\n\2", md)
-        md = re.sub(r"(\n\d+\.\s+.+)\n\n(\d+\.\s+)", r"\1\n\2", md)
+    md = _CAPTION_RE.sub(r"*\1*", md)
+
+    # Collapse blank lines between list items of the same kind, in one pass over the lines
+    lines = md.split("\n")
+    kept = lines[:2]
+    for i in range(2, len(lines)):
+        if not lines[i] and i + 1 < len(lines):
+            above, below = lines[i - 1], lines[i + 1]
+            item = _LIST_ITEM_RE.match(above)
+            if (
+                item and len(above) > item.end()
+                and _LIST_ITEM_RE.match(below)
+                and (above[0] == "-") == (below[0] == "-")
+            ):
+                continue
+        kept.append(lines[i])
+    md = "\n".join(kept)
 
     # Remove the first section heading — redundant after the title block
-    md = re.sub(r"^## .+\n+", "", md, count=1)
+    md = _FIRST_SECTION_RE.sub("", md, count=1)
 
     # Ensure display math ($$...$$) blocks are in their own paragraphs for arithmatex.
     # Arithmatex requires blank lines before/after the $$...$$ block.
     # First, normalize: ensure $$ is on its own line
-    md = re.sub(r"(?<!\n)\$\$", "\n$$", md)
-    md = re.sub(r"\$\$(?!\n)", "$$\n", md)
+    md = _MATH_OPEN_RE.sub("\n$$", md)
+    md = _MATH_CLOSE_RE.sub("$$\n", md)
     # Now match complete $$\n...\n$$ blocks and wrap with blank lines
-    md = re.sub(
-        r"\n?\$\$\n(.*?)\n\$\$\n?",
-        r"\n\n$$\n\1\n$$\n\n",
-        md,
-        flags=re.DOTALL,
-    )
+    md = _MATH_BLOCK_RE.sub(r"\n\n$$\n\1\n$$\n\n", md)
 
     # Clean up excessive newlines
-    md = re.sub(r"\n{3,}", "\n\n", md)
+    md = _BLANK_RE.sub("\n\n", md)
+    return md
+
 
+def render_page(md: str, title: str, subtitle: str | None,
+                published: str | None = None, updated: str | None = None,
+                related_slugs: list[str] | None = None,
+                slug_to_info: dict | None = None) -> str:
+    """Add front matter, title header, and related-essay links to cleaned markdown."""
     # Extract meta description from first paragraph
     description = extract_first_paragraph(md)
     if not description and subtitle:
@@ -265,11 +582,114 @@ def clean_md(md_content: str, title: str, subtitle: str | None,
     return front_matter + header + "\n---\n\n" + md + see_also + "\n"
 
 
+@lru_cache(maxsize=None)
+def pandoc_version() -> str:
+    """First line of ``pandoc --version``, or "" if pandoc is unavailable."""
+    try:
+        result = subprocess.run(
+            ["pandoc", "--version"], stdin=subprocess.DEVNULL, capture_output=True, text=True,
+        )
+    except OSError:
+        return ""
+    return result.stdout.partition("\n")[0]
+
+
+def _find_include(name: str, search_path: list[str]) -> Path | None:
+    """Locate an \\input/\\include target as pandoc does: .tex is implied when no extension is given."""
+    names = [name] if Path(name).suffix else [f"{name}.tex", name]
+    for directory in search_path:
+        for candidate in names:
+            path = Path(directory, candidate)
+            if path.is_file():
+                return path
+    return None
+
+
+def _hash_includes(digest, tex_content: str, search_path: list[str], seen: set[Path]):
+    """Fold the contents of every file tex_content pulls in, recursively, into digest."""
+    for m in _INCLUDE_RE.finditer(tex_content):
+        name = (m.group(1) or m.group(2)).strip()
+        path = _find_include(name, search_path)
+        digest.update(f"|{name}|".encode())
+        if path is None:
+            digest.update(b"<missing>")  # the key changes once the file appears
+            continue
+        if path in seen:
+            continue
+        seen.add(path)
+        content = path.read_text(errors="replace")
+        digest.update(content.encode())
+        _hash_includes(digest, content, search_path, seen)
+
+
+def _cache_path(tex_content: str, tex_path: Path) -> Path:
+    """Location of the cached, cleaned markdown for a given .tex source.
+
+    The key covers the source, every file it \\input/\\includes, the cache
+    version and the pandoc version.
+    """
+    digest = hashlib.sha256(f"{tex_content}|{CACHE_VERSION}|{pandoc_version()}".encode())
+    _hash_includes(digest, tex_content, _tex_search_path(tex_path), set())
+    return CACHE_DIR / f"{digest.hexdigest()[:16]}.md"
+
+
+def _store_body(cache_path: Path, md_content: str) -> str:
+    """Clean converted markdown and cache the result under cache_path."""
+    md = clean_md(md_content)
+    _write_if_changed(cache_path, md)
+    return md
+
+
+def convert_body(
+    tex_content: str, tex_path: Path, cache_path: Path, server_url: str | None = None,
+) -> str | None:
+    """Run pandoc and clean_md for one essay; called from the worker pool."""
+    md_content = tex_to_md(tex_content, tex_path, server_url)
+    if md_content is None:
+        return None
+    return _store_body(cache_path, md_content)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write content to path unless the file already holds exactly that content."""
+    data = content.encode()
+    if path.exists() and path.read_bytes() == data:
+        return False
+    # Per-thread temp name: pool workers converting identical sources share a cache path
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def prune_stale_outputs(keep: set[Path]):
+    """Remove files under DOCS_DIR not written by this run, and any directories left empty."""
+    top = os.fspath(DOCS_DIR)
+    for dirpath, dirnames, filenames in os.walk(top, topdown=False):
+        for name in filenames:
+            path = Path(dirpath, name)
+            if path not in keep:
+                print(f"Removing stale output: {path}")
+                path.unlink()
+        if dirpath != top and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def prune_stale_cache(keep: set[Path]):
+    """Remove cached conversions (and stray temp files) not keyed by any essay in this run."""
+    if not CACHE_DIR.exists():
+        return
+    for path in CACHE_DIR.iterdir():
+        if path not in keep:
+            path.unlink()
+
+
+@lru_cache(maxsize=None)
 def slug(name: str) -> str:
     """Convert a filename to a URL-friendly slug."""
     s = name.replace(".tex", "")
     s = s.lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
+    s = _SLUG_RE.sub("-", s)
     s = s.strip("-")
     return s
 
@@ -277,37 +697,26 @@ def slug(name: str) -> str:
 def build_nav(essay_tree: dict) -> list:
     """Build nested nav structure for mkdocs.yml from the essay tree.
 
-    essay_tree is: {top_category: {sub_or_none: [(title, path)]}}
+    essay_tree is: {top_category: {sub_category: [(title, path)]}}, already
+    sorted, with essays directly under a top category in the "" bucket.
     """
     nav = []
-    for top_cat in sorted(essay_tree.keys()):
-        subs = essay_tree[top_cat]
+    for top_cat, subs in essay_tree.items():
         cat_items = []
-
-        # Articles directly under the top category (no subcategory)
-        if None in subs:
-            for title, path in sorted(subs[None]):
-                cat_items.append({title: path})
-
-        # Subcategories
-        for sub_cat in sorted(k for k in subs if k is not None):
-            sub_items = [{title: path} for title, path in sorted(subs[sub_cat])]
-            cat_items.append({sub_cat: sub_items})
-
+        for sub_cat, items in subs.items():
+            entries = [{title: path} for title, path in items]
+            if sub_cat:
+                cat_items.append({sub_cat: entries})
+            else:
+                cat_items.extend(entries)
         nav.append({top_cat: cat_items})
     return nav
 
 
 def generate_homepage(essay_tree: dict, essays: list):
     """Generate docs/index.md with recent section and collapsible categories."""
-    lines = [
-        "# James Oliver",
-        "",
-        "Finding simplicity in complexity.",
-        "",
-        "---",
-        "",
-    ]
+    out = io.StringIO()
+    out.write("# James Oliver\n\nFinding simplicity in complexity.\n\n---\n\n")
 
     # Recent essays — top 5 by date
     dated = [e for e in essays if e.get("published")]
@@ -315,47 +724,52 @@ def generate_homepage(essay_tree: dict, essays: list):
     recent = dated[:5]
 
     if recent:
-        lines.append("**Recent**")
-        lines.append("")
+        out.write("**Recent**\n\n")
         for e in recent:
-            lines.append(f"- [{e['title']}]({e['nav_path']}) <small>{e['published']}</small>")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-    for top_cat in sorted(essay_tree.keys()):
-        subs = essay_tree[top_cat]
-        total = sum(len(v) for v in subs.values())
-
-        lines.append(f'??? "{top_cat}"')
-        lines.append("")
-
-        # Articles directly under the top category
-        if None in subs:
-            for title, path in sorted(subs[None]):
-                lines.append(f"    - [{title}]({path})")
-            lines.append("")
-
-        # Subcategories as nested dropdowns
-        for sub_cat in sorted(k for k in subs if k is not None):
-            lines.append(f'    ??? "{sub_cat}"')
-            lines.append("")
-            for title, path in sorted(subs[sub_cat]):
-                lines.append(f"        - [{title}]({path})")
-            lines.append("")
-
-        lines.append("")
+            out.write(f"- [{e['title']}]({e['nav_path']}) <small>{e['published']}</small>\n")
+        out.write("\n---\n\n")
+
+    for top_cat, subs in essay_tree.items():
+        out.write(f'??? "{top_cat}"\n\n')
+
+        # Articles directly under the top category, then subcategories as nested dropdowns
+        for sub_cat, items in subs.items():
+            indent = "    "
+            if sub_cat:
+                out.write(f'    ??? "{sub_cat}"\n\n')
+                indent = "        "
+            for title, path in items:
+                out.write(f"{indent}- [{title}]({path})\n")
+            out.write("\n")
+
+        out.write("\n")
 
     homepage = Path("docs/index.md")
-    homepage.write_text("\n".join(lines))
+    # Every write above ends in a newline; the page itself ends one short of that
+    _write_if_changed(homepage, out.getvalue()[:-1])
     print(f"Homepage generated with {len(essay_tree)} categories")
 
 
 def main():
-    # Clean output directory
-    if DOCS_DIR.exists():
-        import shutil
-        shutil.rmtree(DOCS_DIR)
+    parser = argparse.ArgumentParser(description="Convert papers .tex files into MkDocs markdown.")
+    parser.add_argument(
+        "--clean", action="store_true",
+        help="discard existing output and cached conversions before converting",
+    )
+    parser.add_argument(
+        "--verify-fast", action="store_true",
+        help="also convert essays the in-process translator handles with pandoc, "
+             "report any that differ, and keep pandoc's output",
+    )
+    args = parser.parse_args()
+
+    # Output is rewritten incrementally (stale pages are pruned after conversion);
+    # only a clean build starts from scratch
+    if args.clean:
+        for path in (DOCS_DIR, CACHE_DIR):
+            if path.exists():
+                shutil.rmtree(path)
+        GIT_DATES_CACHE.unlink(missing_ok=True)
     DOCS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Rename map for cleaner display of top-level dirs
@@ -364,14 +778,13 @@ def main():
     # --- Pass 1: collect metadata for all essays (needed for cross-links) ---
     essays = []  # list of dicts with all metadata
     slug_to_info = {}  # file_slug -> {title, path} for related-essay lookups
+    first_date, last_date = cached_git_dates()
 
-    for tex_file in sorted(PAPERS_DIR.rglob("*.tex")):
+    for tex_file in find_tex_files():
         rel = tex_file.relative_to(PAPERS_DIR)
         parts = rel.parts
 
-        if parts[0] in SKIP_DIRS:
-            continue
-        if "template" in tex_file.name.lower():
+        if _TEMPLATE_RE.search(tex_file.name):
             continue
 
         tex_content = tex_file.read_text(errors="replace")
@@ -381,15 +794,15 @@ def main():
             continue
 
         # Only publish essays explicitly marked as ready (via LaTeX comment)
-        if not re.search(r"^%\s*PublishReady:\s*yes", tex_content, re.MULTILINE):
+        if not _PUBLISH_READY_RE.search(tex_content):
             continue
 
         subtitle = extract_subtitle(tex_content)
         related_slugs = extract_related_essays(tex_content)
-        published, updated = get_git_dates(rel)
+        published, updated = get_git_dates(rel, first_date, last_date)
 
         top_category = RENAME.get(parts[0], parts[0])
-        sub_category = None
+        sub_category = ""
         if len(parts) > 2:
             sub_category = parts[1]
 
@@ -403,6 +816,7 @@ def main():
 
         info = {
             "tex_file": tex_file,
+            "tex_content": tex_content,
             "rel": rel,
             "title": title,
             "subtitle": subtitle,
@@ -417,29 +831,65 @@ def main():
         essays.append(info)
         slug_to_info[file_slug_val] = {"title": title, "path": nav_path}
 
-    # --- Pass 2: convert and write ---
+    # --- Pass 2: convert (concurrently, via one pandoc server) and write ---
+    # Cleaned markdown is cached by source hash, so unchanged essays skip pandoc entirely
+    md_bodies = []
+    for info in essays:
+        info["cache_path"] = _cache_path(info["tex_content"], info["tex_file"])
+        cached = info["cache_path"]
+        md_bodies.append(cached.read_text() if cached.exists() else None)
+
+    misses = [i for i, body in enumerate(md_bodies) if body is None]
+    if misses:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Simple essays are translated in-process; the rest go to pandoc
+    pending = []
+    fast_bodies = {}
+    for i in misses:
+        md_content = tex_to_md_fast(essays[i]["tex_content"])
+        if md_content is None:
+            pending.append(i)
+        elif args.verify_fast:
+            fast_bodies[i] = clean_md(md_content)
+            pending.append(i)
+        else:
+            md_bodies[i] = _store_body(essays[i]["cache_path"], md_content)
+
+    if pending:
+        with pandoc_server() as server_url, ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = pool.map(
+                partial(convert_body, server_url=server_url),
+                [essays[i]["tex_content"] for i in pending],
+                [essays[i]["tex_file"] for i in pending],
+                [essays[i]["cache_path"] for i in pending],
+            )
+            for i, md_body in zip(pending, results):
+                md_bodies[i] = md_body
+
+    for i, fast_body in fast_bodies.items():
+        if md_bodies[i] is not None and md_bodies[i] != fast_body:
+            print(f"Fast path differs from pandoc: {essays[i]['rel']}")
+
+    # Edited and removed essays leave entries behind that no key will hit again
+    prune_stale_cache({info["cache_path"] for info in essays})
+
     essay_tree = {}
-    seen_titles = {}
+    written = set()
     converted = 0
     failed = 0
 
-    for info in essays:
+    for info, md_body in zip(essays, md_bodies):
         print(f"Converting: {info['rel']}")
 
-        file_slug_for_title = info["file_slug"]
         title = info["title"]
-        if title in seen_titles:
-            seen_titles[title].append(file_slug_for_title)
-        else:
-            seen_titles[title] = [file_slug_for_title]
 
-        md_content = tex_to_md(info["tex_file"])
-        if md_content is None:
+        if md_body is None:
             failed += 1
             continue
 
-        md_content = clean_md(
-            md_content, title, info["subtitle"],
+        md_content = render_page(
+            md_body, title, info["subtitle"],
             info["published"], info["updated"],
             info["related_slugs"], slug_to_info,
         )
@@ -452,7 +902,8 @@ def main():
             out_dir = DOCS_DIR / top_slug
         out_dir.mkdir(parents=True, exist_ok=True)
         out_path = out_dir / f"{info['file_slug']}.md"
-        out_path.write_text(md_content)
+        _write_if_changed(out_path, md_content)
+        written.add(out_path)
 
         nav_path = info["nav_path"]
         top_category = info["top_category"]
@@ -467,40 +918,37 @@ def main():
 
     print(f"\nConverted: {converted}, Failed: {failed}")
 
+    # Without a clean rebuild, pages for removed, renamed, or failing essays linger
+    prune_stale_outputs(written)
+
     # Disambiguate duplicate titles in essay_tree
-    # Collect all (title, path) pairs across the entire tree
-    all_titles = []
-    for top_cat in essay_tree:
-        for sub_cat in essay_tree[top_cat]:
-            for title, path in essay_tree[top_cat][sub_cat]:
-                all_titles.append(title)
-    title_counts = {}
-    for t in all_titles:
-        title_counts[t] = title_counts.get(t, 0) + 1
+    title_counts = Counter(
+        title for subs in essay_tree.values() for items in subs.values() for title, _ in items
+    )
     dupes = {t for t, c in title_counts.items() if c > 1}
 
     if dupes:
         print(f"Disambiguating {len(dupes)} duplicate titles: {dupes}")
-        for top_cat in essay_tree:
-            for sub_cat in essay_tree[top_cat]:
-                new_items = []
-                for title, path in essay_tree[top_cat][sub_cat]:
-                    if title in dupes:
-                        # Append the filename (without extension) to disambiguate
-                        fname = Path(path).stem
-                        # Convert slug back to readable: "glucose1" -> "Glucose1"
-                        readable = fname.replace("-", " ").title()
-                        new_title = f"{title} ({readable})"
-                        new_items.append((new_title, path))
-                    else:
-                        new_items.append((title, path))
-                essay_tree[top_cat][sub_cat] = new_items
+        for subs in essay_tree.values():
+            for sub_cat, items in subs.items():
+                # Append the filename to disambiguate: "glucose1" -> "Glucose (Glucose1)"
+                subs[sub_cat] = [
+                    (f"{title} ({Path(path).stem.replace('-', ' ').title()})" if title in dupes else title, path)
+                    for title, path in items
+                ]
+
+    # Sort once; build_nav and generate_homepage iterate in this order.
+    # The "" bucket (essays with no subcategory) sorts ahead of subcategories.
+    essay_tree = {
+        top_cat: {sub_cat: sorted(subs[sub_cat]) for sub_cat in sorted(subs)}
+        for top_cat, subs in sorted(essay_tree.items())
+    }
 
     # Write nav fragment for mkdocs.yml
     nav_essays = build_nav(essay_tree)
     nav_fragment = {"nav_essays": nav_essays}
-    nav_fpath = Path("docs/_nav.yml")
-    nav_fpath.write_text(yaml.dump(nav_fragment, default_flow_style=False, allow_unicode=True))
+    nav_fpath = Path("docs/_nav.json")
+    _write_if_changed(nav_fpath, json.dumps(nav_fragment, ensure_ascii=False))
     print(f"Nav fragment written to {nav_fpath}")
 
     # Generate homepage with category index
@@ -2,14 +2,18 @@
 """Post-build SEO: inject JSON-LD, canonical URLs, RSS feed, sitemap lastmod."""
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 SITE_DIR = Path("site")
 SITE_URL = "https://jamesxoliver.github.io"
 
+# Page work is mostly file I/O, so run well past one thread per core
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
 # Google Search Console verification (URL prefix method).
 # Set this to your verification meta tag content value, e.g.:
 #   SEARCH_CONSOLE_VERIFICATION = "your-verification-code-here"
@@ -17,22 +21,71 @@ SITE_URL = "https://jamesxoliver.github.io"
 # to every page. Leave as None to skip.
 SEARCH_CONSOLE_VERIFICATION = "Cm624WsCoCiwmhsfLdbV-yrMIAtb4R9b6QUa_aG3K_Q"
 
-
-def extract_meta(html: str) -> dict:
+# Metadata captured from every built page in one scan; each group keeps its
+# first occurrence, as separate searches would. Pages are matched as raw
+# bytes, so only the captured values are decoded.
+_META_RE = re.compile(
+    rb"<title>(?P<title>.+?)</title>"
+    rb'|<meta name="description" content="(?P<description>.+?)"'
+    rb"|Published:\s*(?P<date>\d{4}-\d{2}-\d{2})"
+    rb"|Updated:\s*(?P<updated>\d{4}-\d{2}-\d{2})"
+)
+
+# Tags this script injects, found in one scan to tell which a page already has
+_PRESENCE_RE = re.compile(
+    rb"application/ld\+json|<link rel=\"canonical\"|application/rss\+xml"
+    rb"|og:type|og:site_name|article:published_time|article:modified_time"
+    rb"|article:author|twitter:card|google-site-verification"
+)
+
+# A sitemap <loc> plus the <lastmod> that follows it, if any
+_SITEMAP_LOC_RE = re.compile(
+    r"(?P<indent>[ \t]*)<loc>(?P<loc>[^<]*)</loc>(?:(?P<sep>\s*)<lastmod>[^<]*</lastmod>)?"
+)
+
+# Escapes for text placed inside RSS elements
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def iter_html_files(root: Path = SITE_DIR):
+    """Yield every .html file under root, walking directories with os.scandir."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.endswith(".html"):
+                    yield Path(entry.path)
+
+
+def page_url(html_path: Path) -> str:
+    """Canonical URL of a built page: directory URLs for index.html files."""
+    rel = str(html_path)[len(str(SITE_DIR)) + 1:]
+    if rel == "index.html":
+        return f"{SITE_URL}/"
+    if rel.endswith("/index.html"):
+        return f"{SITE_URL}/{rel[:-len('index.html')]}"
+    return f"{SITE_URL}/{rel}"
+
+
+def extract_meta(html: bytes) -> dict:
     """Extract title, description, and date from built HTML."""
-    title_match = re.search(r"<title>(.+?)</title>", html)
-    title = title_match.group(1).split(" - ")[0].strip() if title_match else ""
-
-    desc_match = re.search(r'<meta name="description" content="(.+?)"', html)
-    description = desc_match.group(1) if desc_match else ""
-
-    date_match = re.search(r"Published:\s*(\d{4}-\d{2}-\d{2})", html)
-    date = date_match.group(1) if date_match else ""
-
-    updated_match = re.search(r"Updated:\s*(\d{4}-\d{2}-\d{2})", html)
-    updated = updated_match.group(1) if updated_match else date
-
-    return {"title": title, "description": description, "date": date, "updated": updated}
+    found = {}
+    for m in _META_RE.finditer(html):
+        if m.lastgroup not in found:
+            found[m.lastgroup] = m.group(m.lastgroup).decode("utf-8", "replace")
+        if len(found) == 4:
+            break
+
+    title = found.get("title", "").split(" - ")[0].strip()
+    date = found.get("date", "")
+    return {
+        "title": title,
+        "description": found.get("description", ""),
+        "date": date,
+        "updated": found.get("updated", date),
+    }
 
 
 def build_jsonld(meta: dict, url: str) -> str:
@@ -66,94 +119,96 @@ def build_jsonld(meta: dict, url: str) -> str:
 
 
 def inject_into_html(html_path: Path):
-    """Inject JSON-LD and canonical URL into an HTML file."""
-    html = html_path.read_text(errors="replace")
-
-    # Compute canonical URL from file path
-    rel = html_path.relative_to(SITE_DIR)
-    if rel.name == "index.html" and rel.parent != Path("."):
-        canonical = f"{SITE_URL}/{rel.parent}/"
-    elif rel.name == "index.html":
-        canonical = f"{SITE_URL}/"
+    """Inject JSON-LD and canonical URL into an HTML file.
+
+    Returns (url, lastmod) for the sitemap when the page carries a date,
+    else None.
+    """
+    html = html_path.read_bytes()
+
+    canonical = page_url(html_path)
+
+    # Only essay pages carry metadata worth scanning for (dates, JSON-LD)
+    is_essay = "/essays/" in str(html_path)
+    if is_essay:
+        meta = extract_meta(html)
     else:
-        canonical = f"{SITE_URL}/{rel}"
+        meta = {"title": "", "description": "", "date": "", "updated": ""}
+    date_str = meta["updated"] or meta["date"]
+    entry = (canonical, date_str) if date_str else None
 
     # Skip if already injected
-    if "application/ld+json" in html:
-        return
-
-    meta = extract_meta(html)
+    present = {m[0] for m in _PRESENCE_RE.finditer(html)}
+    if b"application/ld+json" in present:
+        return entry
 
     # Build injection block
     injections = []
 
     # Google Search Console verification
-    if SEARCH_CONSOLE_VERIFICATION and 'google-site-verification' not in html:
+    if SEARCH_CONSOLE_VERIFICATION and b'google-site-verification' not in present:
         injections.append(
             f'<meta name="google-site-verification" content="{SEARCH_CONSOLE_VERIFICATION}" />'
         )
 
     # Canonical URL
-    if f'<link rel="canonical"' not in html:
+    if b'<link rel="canonical"' not in present:
         injections.append(f'<link rel="canonical" href="{canonical}" />')
 
     # RSS feed link
-    if 'application/rss+xml' not in html:
+    if b'application/rss+xml' not in present:
         injections.append(
             f'<link rel="alternate" type="application/rss+xml" title="James Oliver" href="{SITE_URL}/feed.xml" />'
         )
 
     # Open Graph tags (supplement what MkDocs Material generates)
-    if 'og:type' not in html:
+    if b'og:type' not in present:
         injections.append('<meta property="og:type" content="article" />')
-    if 'og:site_name' not in html:
+    if b'og:site_name' not in present:
         injections.append('<meta property="og:site_name" content="James Oliver" />')
-    if meta["date"] and 'article:published_time' not in html:
+    if meta["date"] and b'article:published_time' not in present:
         injections.append(f'<meta property="article:published_time" content="{meta["date"]}" />')
-    if meta["updated"] and 'article:modified_time' not in html:
+    if meta["updated"] and b'article:modified_time' not in present:
         injections.append(f'<meta property="article:modified_time" content="{meta["updated"]}" />')
-    if 'article:author' not in html:
+    if b'article:author' not in present:
         injections.append('<meta property="article:author" content="James Oliver" />')
 
     # Twitter card
-    if 'twitter:card' not in html:
+    if b'twitter:card' not in present:
         injections.append('<meta name="twitter:card" content="summary" />')
 
     # JSON-LD structured data (only for essay pages)
-    if "/essays/" in str(html_path):
+    if is_essay:
         jsonld = build_jsonld(meta, canonical)
         injections.append(f'<script type="application/ld+json">{jsonld}</script>')
 
     if not injections:
-        return
+        return entry
+
+    head_end = html.find(b"</head>")
+    if head_end < 0:
+        return entry
 
     injection_block = "\n    ".join(injections)
-    html = html.replace("</head>", f"    {injection_block}\n  </head>")
-    html_path.write_text(html)
+    html_path.write_bytes(html[:head_end] + f"    {injection_block}\n  ".encode() + html[head_end:])
+    return entry
 
 
 def generate_rss_feed():
     """Generate an RSS 2.0 feed from essay HTML files."""
     essays = []
 
-    for html_file in sorted(SITE_DIR.rglob("*.html")):
+    for html_file in sorted(iter_html_files()):
         if "/essays/" not in str(html_file):
             continue
-        html = html_file.read_text(errors="replace")
-        meta = extract_meta(html)
+        meta = extract_meta(html_file.read_bytes())
         if not meta["title"] or not meta["date"]:
             continue
 
-        rel = html_file.relative_to(SITE_DIR)
-        if rel.name == "index.html" and rel.parent != Path("."):
-            url = f"{SITE_URL}/{rel.parent}/"
-        else:
-            url = f"{SITE_URL}/{rel}"
-
         essays.append({
             "title": meta["title"],
             "description": meta["description"],
-            "url": url,
+            "url": page_url(html_file),
             "date": meta["date"],
             "updated": meta["updated"],
         })
@@ -166,8 +221,8 @@ def generate_rss_feed():
     items = []
     for e in essays[:50]:  # cap at 50 items
         pub_date = datetime.strptime(e["date"], "%Y-%m-%d").strftime("%a, %d %b %Y 00:00:00 +0000")
-        desc_escaped = e["description"].replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        title_escaped = e["title"].replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        desc_escaped = e["description"].translate(_XML_ESCAPE)
+        title_escaped = e["title"].translate(_XML_ESCAPE)
         items.append(f"""    <item>
       <title>{title_escaped}</title>
       <link>{e["url"]}</link>
@@ -194,65 +249,39 @@ def generate_rss_feed():
     print(f"RSS feed generated with {len(items)} items")
 
 
-def inject_sitemap_lastmod():
+def inject_sitemap_lastmod(url_dates: dict):
     """Inject <lastmod> dates into sitemap.xml using essay publication dates."""
     sitemap_path = SITE_DIR / "sitemap.xml"
     if not sitemap_path.exists():
         return
 
-    # Collect date info from essay HTML files
-    url_dates = {}
-    for html_file in SITE_DIR.rglob("*.html"):
-        html = html_file.read_text(errors="replace")
-        meta = extract_meta(html)
-        date_str = meta.get("updated") or meta.get("date")
-        if not date_str:
-            continue
-
-        rel = html_file.relative_to(SITE_DIR)
-        if rel.name == "index.html" and rel.parent != Path("."):
-            url = f"{SITE_URL}/{rel.parent}/"
-        elif rel.name == "index.html":
-            url = f"{SITE_URL}/"
-        else:
-            url = f"{SITE_URL}/{rel}"
-        url_dates[url] = date_str
-
     if not url_dates:
         return
 
-    # Parse and update sitemap
-    ET.register_namespace("", "http://www.sitemaps.org/schemas/sitemap/0.9")
-    tree = ET.parse(sitemap_path)
-    root = tree.getroot()
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-
     updated = 0
-    for url_elem in root.findall("sm:url", ns):
-        loc = url_elem.find("sm:loc", ns)
-        if loc is None:
-            continue
-        loc_text = loc.text
-        if loc_text in url_dates:
-            lastmod = url_elem.find("sm:lastmod", ns)
-            if lastmod is None:
-                lastmod = ET.SubElement(url_elem, "lastmod")
-            lastmod.text = url_dates[loc_text]
-            updated += 1
-
-    tree.write(sitemap_path, xml_declaration=True, encoding="UTF-8")
+
+    def set_lastmod(m: re.Match) -> str:
+        nonlocal updated
+        date_str = url_dates.get(m["loc"])
+        if not date_str:
+            return m[0]
+        updated += 1
+        sep = m["sep"] if m["sep"] is not None else f"\n{m['indent']}"
+        return f"{m['indent']}<loc>{m['loc']}</loc>{sep}<lastmod>{date_str}</lastmod>"
+
+    sitemap = _SITEMAP_LOC_RE.sub(set_lastmod, sitemap_path.read_text())
+    sitemap_path.write_text(sitemap)
     print(f"Sitemap updated with {updated} lastmod dates")
 
 
 def main():
-    count = 0
-    for html_file in SITE_DIR.rglob("*.html"):
-        inject_into_html(html_file)
-        count += 1
-    print(f"SEO injected into {count} HTML files")
+    html_files = list(iter_html_files())
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        entries = list(pool.map(inject_into_html, html_files))
+    print(f"SEO injected into {len(html_files)} HTML files")
 
     generate_rss_feed()
-    inject_sitemap_lastmod()
+    inject_sitemap_lastmod(dict(e for e in entries if e))
 
 
 if __name__ == "__main__":